@@ -1,51 +1,155 @@
+import asyncio
 from urllib.parse import urljoin
 
 from rnet import Client
 from rnet import Impersonate
 from rnet import Response
 
+POOL_MAX_IDLE_PER_HOST = 16
+"""Idle keep-alive connections the shared client keeps open per host."""
+
+REDIRECT_STATUSES: frozenset[int] = frozenset({301, 302, 303, 307, 308})
+RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+"""Rate limits and transient server errors worth retrying."""
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 0.1
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+_CLIENT: Client | None = None
+
+
+def _get_client() -> Client:
+    """Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps TLS sessions and keep-alive connections pooled
+    across downloads instead of paying a fresh handshake for every page.
+    There is no await between the check and the assignment, so this is
+    race-free on the event loop without a lock.
+
+    Returns:
+        The module-level rnet Client.
+    """
+    global _CLIENT  # noqa: PLW0603
+    if _CLIENT is None:
+        _CLIENT = Client(
+            impersonate=Impersonate.Chrome137,
+            pool_max_idle_per_host=POOL_MAX_IDLE_PER_HOST,
+        )
+    return _CLIENT
+
+
+async def aclose() -> None:  # noqa: RUF029
+    """Drop the shared HTTP client so its connection pool is released.
+
+    The next call to download_page() will create a new client.
+    """
+    global _CLIENT  # noqa: PLW0603
+    _CLIENT = None
+
+
+def _header_str(value: bytes | str | None, errors: str = "strict") -> str | None:
+    """Return a header value as str; rnet may hand back bytes.
+
+    Args:
+        value: The raw header value, if present.
+        errors: How to handle bytes that are not valid UTF-8, as for
+            bytes.decode().
+
+    Returns:
+        The decoded header value, or None if it is missing or empty.
+    """
+    if not value:
+        return None
+
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors)
+
+    return str(value)
+
+
+def _retry_delay(resp: Response, attempt: int) -> float:
+    """Seconds to wait before retrying a transient failure.
+
+    Honors a numeric Retry-After header (capped at MAX_RETRY_AFTER_SECONDS)
+    and otherwise backs off exponentially.
+
+    Args:
+        resp: The failed response.
+        attempt: Zero-based index of the attempt that failed.
+
+    Returns:
+        The delay in seconds.
+    """
+    retry_after: str | None = _header_str(
+        resp.headers.get("Retry-After"),
+        errors="replace",
+    )
+    if retry_after and retry_after.strip().isdecimal():
+        return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+
+    return RETRY_BACKOFF_SECONDS * 2**attempt
+
+
+async def _get_with_retries(client: Client, url: str) -> Response:
+    """GET a URL, retrying rate limits and transient server errors.
+
+    Args:
+        client: The HTTP client to use.
+        url: The URL to request.
+
+    Returns:
+        The first non-transient response, or the last one if every attempt
+        failed.
+    """
+    resp: Response = await client.get(url)
+    for attempt in range(MAX_ATTEMPTS - 1):
+        if resp.status not in RETRY_STATUSES:
+            break
+
+        await asyncio.sleep(_retry_delay(resp, attempt))
+        resp = await client.get(url)
+
+    return resp
+
 
 async def download_page(url: str) -> Response:
     """Download the content of a web page given its URL.
 
+    Redirects are followed manually. Rate limits (429) and transient 5xx
+    responses are retried with exponential backoff.
+
     Args:
         url (str): The URL of the web page to download.
 
     Raises:
-        RuntimeError: If no response is received after following redirects.
+        RuntimeError: If the redirects loop or exceed the redirect limit.
 
     Returns:
         The response
     """
-    client = Client(impersonate=Impersonate.Chrome137)
+    client: Client = _get_client()
     max_redirects = 5
-    resp: Response | None = None
+    visited: set[str] = set()
     for _ in range(max_redirects):
-        resp = await client.get(url)
-        # If status is 301/302, follow the Location header
-        if resp.status in {301, 302, 303, 307, 308}:
-            location: bytes | None = resp.headers.get("Location")
-            if not location:
-                break
-
-            # rnet may return bytes for headers, decode if needed
-            # Always convert location to str
-            if isinstance(location, bytes):
-                location_str: str = location.decode("utf-8")
-            else:
-                location_str = str(location)
-
-            # Handle relative redirects
-            if location_str.startswith("/"):
-                url = urljoin(url, location_str)
-            else:
-                url = location_str
-            continue
-        return resp
-
-    # If too many redirects or no valid response, return last response text
-    if resp is not None:
-        return resp
-
-    msg = "No response received from client.get()"
+        if url in visited:
+            msg = f"Redirect loop detected at {url}"
+            raise RuntimeError(msg)
+        visited.add(url)
+
+        resp: Response = await _get_with_retries(client, url)
+        if resp.status not in REDIRECT_STATUSES:
+            return resp
+
+        # Follow the Location header
+        location: str | None = _header_str(resp.headers.get("Location"))
+        if not location:
+            return resp
+
+        # Absolute redirects are used as-is; only relative ones need urljoin
+        if location.startswith(("http://", "https://")):
+            url = location
+        else:
+            url = urljoin(url, location)
+
+    msg = f"Too many redirects (more than {max_redirects}) while downloading {url}"
     raise RuntimeError(msg)
@@ -1,40 +1,108 @@
 from __future__ import annotations
 
-import logging
+import asyncio
+import hashlib
 import re
+import sys
+import threading
+from collections import OrderedDict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Literal
+from typing import NamedTuple
 from urllib.parse import ParseResult
 from urllib.parse import urlparse
 
+from loguru import logger
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 from rnet import Response  # noqa: TC002
-from selectolax.parser import HTMLParser
-from selectolax.parser import Node
+from selectolax.lexbor import LexborAttributes
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+from selectolax.lexbor import LexborNode as Node
 
 from webscrapers import download_page
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-
-
-logger: logging.Logger = logging.getLogger(__name__)
+    from collections.abc import Iterable
+    from collections.abc import Iterator
 
 
 class RedditScraperError(Exception):
     """Custom exception for Reddit scraper errors."""
 
 
-_POST_ID_RE: re.Pattern[str] = re.compile(r"^[a-zA-Z0-9]{5,8}$")
-_COMMENT_ID_RE: re.Pattern[str] = re.compile(r"^[a-zA-Z0-9]{6,10}$")
+MIN_POST_ID_LENGTH = 5
+MAX_POST_ID_LENGTH = 8
+MIN_COMMENT_ID_LENGTH = 6
+MAX_COMMENT_ID_LENGTH = 10
+_REDDIT_PATH_RE: re.Pattern[str] = re.compile(
+    r"^(?:/r/(?P<subreddit>[^/]+)"
+    r"(?:/comments/(?P<post_id>[a-zA-Z0-9]{5,8})"
+    r"(?:/[^/]+(?:/(?P<comment_id>[a-zA-Z0-9]{6,10}))?)?)?"
+    r"|/u(?:ser)?/(?P<username>[^/]+))?/?$",
+    re.ASCII,
+)
+"""Canonical reddit.com paths: frontpage, subreddit, post, comment and user."""
+_POST_URL_RE: re.Pattern[str] = re.compile(
+    r"^https?://"
+    r"(?:(?i:(?:[a-z0-9-]+\.)*reddit\.com)/r/(?!(?i:popular|all)/)[^/?#]+/comments/"
+    r"|(?i:(?:www\.)?redd\.it)/)"
+    r"(?P<post_id>[a-zA-Z0-9]{5,8})(?:[/?#]|$)",
+    re.ASCII,
+)
+"""Common post and shortlink URLs, used to pull out just the post ID.
+
+re.ASCII keeps the case-insensitive host match from accepting Unicode
+look-alikes such as "reddİt.com", which full URL parsing rejects.
+"""
 SHORTLINK_HOSTS: set[str] = {"redd.it", "www.redd.it"}
 MIN_SUBREDDIT_SEGMENTS = 2
 MIN_POST_SEGMENTS = 4
 MIN_COMMENT_SEGMENTS = 6
 
+URL_CACHE_SIZE = 16384
+"""How many parsed URLs get_reddit_id_from_url() keeps memoized."""
+DEFAULT_CONCURRENCY = 16
+"""How many posts scrape_posts() downloads at once unless told otherwise."""
+PARSE_CACHE_SIZE = 32
+"""How many parsed pages parse_reddit_post_html() keeps, keyed by content hash.
+
+A parsed page holds roughly half a megabyte, so this stays small.
+"""
+
+# CSS selectors used by the HTML parser, defined once at import time.
+_SEL_POST: str = "div.thing.link"
+_SEL_COMMENT_AREA: str = "div.commentarea div.sitetable.nestedlisting"
+_COMMENT_AREA_TAGS: tuple[str, ...] = (
+    "<div class='commentarea'",
+    '<div class="commentarea"',
+)
+"""Opening tags of the comment area, used to cut it off for metadata-only parses."""
+_SEL_COMMENT: str = "div.thing.comment"
+_SEL_POST_TITLE: str = "a.title"
+_SEL_POST_AUTHOR: str = "p.tagline a.author"
+_SEL_POST_FLAIR: str = "span.linkflairlabel"
+_SEL_POST_BODY: str = "div.expando div.usertext-body div.md"
+_SEL_POST_SCORE: str = "div.score.unvoted"
+_SEL_AUTHOR: str = "a.author"
+_SEL_TAGLINE: str = "p.tagline"
+_SEL_COMMENT_BODY: str = "div.usertext-body div.md"
+_SEL_COMMENT_SCORE: str = "span.score.unvoted"
+_SEL_TIMESTAMP: str = "time.live-timestamp"
+_SEL_PERMALINK: str = "a[data-event-action='permalink']"
+_SEL_PARENT_LINK: str = "a[data-event-action='parent']"
+_SEL_COMMENT_FIELDS: str = (
+    f"{_SEL_COMMENT_BODY}, {_SEL_COMMENT_SCORE}, {_SEL_TIMESTAMP}, {_SEL_PERMALINK}"
+)
+"""All per-comment field selectors, matched together in a single query."""
+
 
 RedditKind = Literal[
     "frontpage",
@@ -47,7 +115,7 @@ RedditKind = Literal[
 ]
 
 
-class RedditUrlInfo(BaseModel):
+class RedditUrlInfo(NamedTuple):
     """Parsed details from a Reddit URL.
 
     Represents parsed components of a Reddit URL, including its original link,
@@ -55,6 +123,11 @@ class RedditUrlInfo(BaseModel):
     a convenience property to determine whether the URL references a specific post
     or comment.
 
+    This is a NamedTuple rather than a pydantic model: the URL parser only
+    builds it from already-checked values, so there is nothing to validate,
+    and it is immutable and hashable as required by the get_reddit_id_from_url()
+    cache.
+
     Attributes:
         kind: The type of Reddit URL (e.g., 'post', 'comment', 'user', etc.).
         original_url: The original Reddit URL that was parsed.
@@ -64,11 +137,6 @@ class RedditUrlInfo(BaseModel):
         comment_id: The comment ID if applicable.
     """
 
-    model_config = ConfigDict(frozen=True)
-    """Whether models are faux-immutable, i.e. whether `__setattr__` is allowed,
-     a `__hash__()` method for the model. This makes instances of the model
-     potentially hashable if all the attributes are hashable."""
-
     kind: RedditKind
     """The type of Reddit URL (e.g., 'post', 'comment', 'user', etc.)."""
 
@@ -141,8 +209,8 @@ class RedditPostData(BaseModel):
     flair: str | None = None
     comments: tuple[RedditCommentData, ...] = ()
 
-    response: Response = Field(exclude=True)
-    """A response from a request."""
+    response: Response | None = Field(default=None, exclude=True)
+    """A response from a request, if the page was downloaded by the scraper."""
 
 
 class RedditCommentData(BaseModel):
@@ -229,6 +297,25 @@ class RedditCommentData(BaseModel):
     """Child comments (replies to this comment). Use build_comment_tree() for trees."""
 
 
+def _is_post_id(value: str) -> bool:
+    """Return True if value looks like a Reddit post ID (5-8 alphanumerics)."""
+    return (
+        MIN_POST_ID_LENGTH <= len(value) <= MAX_POST_ID_LENGTH
+        and value.isascii()
+        and value.isalnum()
+    )
+
+
+def _is_comment_id(value: str) -> bool:
+    """Return True if value looks like a Reddit comment ID (6-10 alphanumerics)."""
+    return (
+        MIN_COMMENT_ID_LENGTH <= len(value) <= MAX_COMMENT_ID_LENGTH
+        and value.isascii()
+        and value.isalnum()
+    )
+
+
+@lru_cache(maxsize=1024)
 def _normalize_netloc(netloc: str) -> str:
     return netloc.lower().split(":", maxsplit=1)[0]
 
@@ -237,8 +324,8 @@ def _split_path(path: str) -> list[str]:
     return [segment for segment in path.split("/") if segment]
 
 
-def _parse_reddit_domain(parsed_netloc: str) -> bool:
-    netloc: str = _normalize_netloc(parsed_netloc)
+@lru_cache(maxsize=1024)
+def _parse_reddit_domain(netloc: str) -> bool:
     if netloc in SHORTLINK_HOSTS:
         return True
     return netloc == "reddit.com" or netloc.endswith(".reddit.com")
@@ -253,7 +340,7 @@ def _parse_shortlink(
         return None
 
     slug: str = segments[0] if segments else ""
-    if not _POST_ID_RE.match(slug):
+    if not _is_post_id(slug):
         msg = "Shortlink missing a valid post ID"
         raise RedditScraperError(msg)
 
@@ -292,14 +379,14 @@ def _parse_subreddit_path(
 
     if len(segments) >= MIN_POST_SEGMENTS and segments[2] == "comments":
         post_id: str = segments[3]
-        if not _POST_ID_RE.match(post_id):
+        if not _is_post_id(post_id):
             msg = "URL contains an invalid post ID"
             raise RedditScraperError(msg)
 
         comment_id = None
         if len(segments) >= MIN_COMMENT_SEGMENTS:
             candidate: str = segments[5]
-            if _COMMENT_ID_RE.match(candidate):
+            if _is_comment_id(candidate):
                 comment_id = candidate.lower()
 
         kind: RedditKind = "comment" if comment_id else "post"
@@ -331,9 +418,59 @@ def _parse_user_path(
     return RedditUrlInfo(kind="user", original_url=url, username=username)
 
 
+def _parse_canonical_path(path: str, url: str) -> RedditUrlInfo | None:
+    """Parse a canonical reddit.com path with a single regex match.
+
+    Handles the common URL shapes in one pass. Anything else, such as extra
+    path segments, doubled slashes or invalid IDs, returns None so the
+    segment-based parsers can handle it (or raise the right error).
+
+    Args:
+        path: The URL path.
+        url: The original URL.
+
+    Returns:
+        RedditUrlInfo for a canonical path, otherwise None.
+    """
+    match: re.Match[str] | None = _REDDIT_PATH_RE.match(path)
+    if match is None:
+        return None
+
+    subreddit, post_id, comment_id, username = match.group(
+        "subreddit",
+        "post_id",
+        "comment_id",
+        "username",
+    )
+
+    if username:
+        return RedditUrlInfo(kind="user", original_url=url, username=username)
+    if subreddit is None:
+        return RedditUrlInfo(kind="frontpage", original_url=url)
+    listing: str = subreddit.lower()
+    if listing in {"popular", "all"}:
+        kind: RedditKind = "popular" if listing == "popular" else "all"
+        return RedditUrlInfo(kind=kind, original_url=url)
+    if post_id is None:
+        return RedditUrlInfo(kind="subreddit", original_url=url, subreddit=subreddit)
+
+    return RedditUrlInfo(
+        kind="comment" if comment_id else "post",
+        original_url=url,
+        subreddit=subreddit,
+        post_id=post_id.lower(),
+        comment_id=comment_id.lower() if comment_id else None,
+    )
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
 def get_reddit_id_from_url(url: str) -> RedditUrlInfo:
     """Parse Reddit URL details.
 
+    Results are memoized per URL string. RedditUrlInfo is immutable, so
+    callers can safely share the cached instances. Invalid URLs are not
+    cached and raise on every call.
+
     Args:
         url: Any Reddit URL (posts, comments, users, subreddits,
             frontpage, or shortlinks)
@@ -350,11 +487,16 @@ def get_reddit_id_from_url(url: str) -> RedditUrlInfo:
 
     parsed: ParseResult = urlparse(url.strip())
 
-    if not _parse_reddit_domain(parsed.netloc):
+    netloc: str = _normalize_netloc(parsed.netloc)
+    if not _parse_reddit_domain(netloc):
         msg = "URL does not belong to reddit"
         raise RedditScraperError(msg)
 
-    netloc: str = _normalize_netloc(parsed.netloc)
+    if netloc not in SHORTLINK_HOSTS:
+        canonical: RedditUrlInfo | None = _parse_canonical_path(parsed.path, url)
+        if canonical:
+            return canonical
+
     segments: list[str] = _split_path(parsed.path)
 
     parsers: tuple[
@@ -392,14 +534,11 @@ def build_comment_tree(
     Returns:
         A dict mapping parent_id (or None for top-level) to list of children.
     """
-    tree: dict[str | None, list[RedditCommentData]] = {}
+    tree: defaultdict[str | None, list[RedditCommentData]] = defaultdict(list)
     for comment in comments:
-        parent: str | None = comment.parent_id
-        if parent not in tree:
-            tree[parent] = []
-        tree[parent].append(comment)
+        tree[comment.parent_id].append(comment)
 
-    return tree
+    return dict(tree)
 
 
 def _normalize_text(text: str | None) -> str | None:
@@ -417,6 +556,33 @@ def _normalize_text(text: str | None) -> str | None:
     return " ".join(text.split())
 
 
+def _intern(value: str | None) -> str | None:
+    """Return the interned copy of a string, passing None through.
+
+    Args:
+        value: The string to intern, if any.
+
+    Returns:
+        The interned string, or None.
+    """
+    return sys.intern(value) if value else value
+
+
+def _class_set(class_attr: str | None) -> frozenset[str]:
+    """Split a class attribute into its tokens.
+
+    Membership tests on the tokens avoid substring false positives such as
+    "stickied" matching "unstickied".
+
+    Args:
+        class_attr: The value of a node's class attribute, if any.
+
+    Returns:
+        The classes, or an empty set if there are none.
+    """
+    return frozenset((class_attr or "").split())
+
+
 def _extract_fullname_id(fullname: str | None) -> str | None:
     """Extract the ID portion from a Reddit fullname (e.g., 't3_abc123' -> 'abc123').
 
@@ -449,10 +615,11 @@ def _parse_timestamp(time_element: Node | None) -> datetime | None:
     if time_element is None:
         return None
 
-    dt_str: str | None = time_element.attributes.get("datetime")
+    dt_str: str | None = time_element.attrs.get("datetime")
     if not dt_str:
         return None
 
+    # fromisoformat() is implemented in C and much faster than a regex parse
     try:
         return datetime.fromisoformat(dt_str)
     except ValueError:
@@ -471,7 +638,7 @@ def _parse_score(score_element: Node | None) -> int | None:
     if score_element is None:
         return None
 
-    title: str | None = score_element.attributes.get("title")
+    title: str | None = score_element.attrs.get("title")
     if title:
         try:
             return int(title)
@@ -481,7 +648,8 @@ def _parse_score(score_element: Node | None) -> int | None:
     return None
 
 
-class _CommentParseContext(BaseModel):
+@dataclass(slots=True, frozen=True)
+class _CommentParseContext:
     """Context data extracted from a comment node for building RedditCommentData."""
 
     comment_id: str | None
@@ -499,8 +667,43 @@ class _CommentParseContext(BaseModel):
     stickied: bool
 
 
+def _scan_entry(entry: Node) -> dict[str, Node]:
+    """Collect the field nodes of a comment entry with one selector query.
+
+    Runs all per-comment selectors as a single selector list instead of one
+    css_first() per field, then buckets each match by tag. Only the first
+    match per bucket is kept, like css_first() would return. Lexbor re-parses
+    the selector list on every call, so it only holds the fields every
+    comment needs; rarer lookups (author link, tagline, parent link) query
+    the entry themselves.
+
+    Args:
+        entry: The entry div of the comment.
+
+    Returns:
+        Dict with any of the keys 'body', 'score', 'time' and 'permalink'
+        mapped to the matching node.
+    """
+    fields: dict[str, Node] = {}
+    for match in entry.css(_SEL_COMMENT_FIELDS):
+        tag: str | None = match.tag
+        if tag == "a":
+            key: str = "permalink"
+        elif tag == "div":
+            key = "body"
+        elif tag == "span":
+            key = "score"
+        else:
+            key = "time"
+
+        if key not in fields:
+            fields[key] = match
+
+    return fields
+
+
 def _extract_comment_author(entry: Node, *, is_deleted: bool) -> str | None:
-    """Extract author name from a comment entry node.
+    """Extract author name from the tagline of a comment entry.
 
     Args:
         entry: The entry div of the comment.
@@ -509,12 +712,12 @@ def _extract_comment_author(entry: Node, *, is_deleted: bool) -> str | None:
     Returns:
         Author username or '[deleted]' if deleted.
     """
-    author_elem: Node | None = entry.css_first("a.author")
+    author_elem: Node | None = entry.css_first(_SEL_AUTHOR)
     if author_elem:
         return author_elem.text(strip=True)
 
     # Check for deleted author indicated by span with [deleted]
-    tagline: Node | None = entry.css_first("p.tagline")
+    tagline: Node | None = entry.css_first(_SEL_TAGLINE)
     if tagline:
         tagline_text: str = tagline.text()
         if "[deleted]" in tagline_text:
@@ -527,7 +730,7 @@ def _extract_comment_author(entry: Node, *, is_deleted: bool) -> str | None:
 
 
 def _extract_parent_id(entry: Node) -> str | None:
-    """Extract parent comment ID from a comment entry.
+    """Extract parent comment ID from the parent link of a comment entry.
 
     Args:
         entry: The entry div of the comment.
@@ -535,115 +738,160 @@ def _extract_parent_id(entry: Node) -> str | None:
     Returns:
         Parent comment ID or None if top-level comment.
     """
-    parent_link: Node | None = entry.css_first("a[data-event-action='parent']")
+    parent_link: Node | None = entry.css_first(_SEL_PARENT_LINK)
     if parent_link:
-        href: str | None = parent_link.attributes.get("href")
+        href: str | None = parent_link.attrs.get("href")
         if href and href.startswith("#"):
             return href[1:]
 
     return None
 
 
-def _build_comment_context(node: Node) -> _CommentParseContext | None:
+def _build_comment_context(
+    node: Node,
+    parent_id: str | None = None,
+) -> _CommentParseContext | None:
     """Build comment context from a comment node.
 
     Args:
         node: The div.thing.comment node.
+        parent_id: ID of the parent comment, if the caller already knows it.
+            Otherwise it is read from the comment's parent link, which is
+            only present on replies.
 
     Returns:
         _CommentParseContext or None if invalid.
     """
-    fullname: str | None = node.attributes.get("data-fullname")
-    comment_id: str | None = _extract_fullname_id(fullname)
+    # Node.attributes copies every attribute into a new dict; attrs.get()
+    # looks up just the one we need
+    attributes: LexborAttributes = node.attrs
+    comment_id: str | None = _extract_fullname_id(attributes.get("data-fullname"))
     if not comment_id:
         return None
 
-    node_class: str = node.attributes.get("class") or ""
-    is_deleted_class: bool = "deleted" in node_class
+    classes: frozenset[str] = _class_set(attributes.get("class"))
+    is_deleted_class: bool = "deleted" in classes
 
-    entry: Node | None = node.css_first("div.entry")
+    entry: Node | None = _find_direct_child(node, "entry")
     if not entry:
         return None
 
-    content_div: Node | None = entry.css_first("div.usertext-body div.md")
+    fields: dict[str, Node] = _scan_entry(entry)
+
+    content_div: Node | None = fields.get("body")
     if not content_div:
         return None
 
-    content_html: str | None = content_div.html
     content_text: str = content_div.text(strip=True)
 
     is_removed: bool = content_text == "[removed]"
     is_deleted: bool = content_text == "[deleted]"
     is_deleted: bool = is_deleted_class or is_deleted
 
-    author: str | None = _extract_comment_author(entry, is_deleted=is_deleted)
-
-    node_class: str = node.attributes.get("class") or ""
+    # data-author is missing on deleted comments, so fall back to the tagline
+    author: str | None = attributes.get("data-author") or _extract_comment_author(
+        entry,
+        is_deleted=is_deleted,
+    )
+    # The same names repeat across a thread ("[deleted]", the OP,
+    # AutoModerator), so share one string object per name
+    author = _intern(author)
 
     distinguished: str | None = None
-    if "moderator" in node_class:
+    if "moderator" in classes:
         distinguished = "moderator"
-    elif "admin" in node_class:
+    elif "admin" in classes:
         distinguished = "admin"
 
-    stickied: bool = "stickied" in node_class
+    stickied: bool = "stickied" in classes
 
-    permalink_elem: Node | None = entry.css_first("a[data-event-action='permalink']")
-    permalink: str | None = (
-        permalink_elem.attributes.get("href") if permalink_elem else None
-    )
+    permalink_elem: Node | None = fields.get("permalink")
+    permalink: str | None = permalink_elem.attrs.get("href") if permalink_elem else None
 
     return _CommentParseContext(
         comment_id=comment_id,
         author=author,
-        score=_parse_score(entry.css_first("span.score.unvoted")),
-        date_posted=_parse_timestamp(entry.css_first("time.live-timestamp")),
-        content_html=content_html,
+        score=_parse_score(fields.get("score")),
+        date_posted=_parse_timestamp(fields.get("time")),
+        content_html=content_div.html,
         content_text=content_text,
         permalink=permalink,
-        parent_id=_extract_parent_id(entry),
+        parent_id=parent_id or _extract_parent_id(entry),
         is_deleted=is_deleted,
         is_removed=is_removed,
-        is_submitter="submitter" in node_class,
+        is_submitter="submitter" in classes,
         distinguished=distinguished,
         stickied=stickied,
     )
 
 
-def _parse_comment_node(
-    node: Node,
-    post_id: str | None,
-    depth: int = 0,
-) -> RedditCommentData | None:
-    """Parse a single comment node from the HTML.
+def _iter_comment_contexts(
+    comment_area: Node,
+) -> Iterator[tuple[_CommentParseContext, int, int | None]]:
+    """Yield parsed comment contexts in document order, without recursion.
+
+    All comment nodes are selected with one query, which returns them in
+    document order, i.e. every parent before its replies. Each reply's parent
+    is found through its reply container (comment > div.child >
+    div.sitetable > reply), which also gives its parent ID without reading
+    the parent link. Replies of comments that were skipped are skipped too.
 
     Args:
-        node: The div.thing.comment node to parse.
-        post_id: The ID of the post this comment belongs to.
-        depth: The nesting depth of this comment.
+        comment_area: The sitetable holding the top-level comments.
 
-    Returns:
-        RedditCommentData object or None if the node is not a valid comment.
+    Yields:
+        (context, depth, parent index) for every parsed comment, where the
+        parent index counts previously yielded comments and is None for
+        top-level comments.
     """
-    if node.attributes.get("data-type") == "morechildren":
-        return None
-
-    ctx: _CommentParseContext | None = _build_comment_context(node)
-    if ctx is None:
-        return None
+    area_id: int = comment_area.mem_id
+    # Yielded comments by node identity, as (index, depth, comment ID)
+    positions: dict[int, tuple[int, int, str]] = {}
+    for node in comment_area.css(_SEL_COMMENT):
+        container: Node | None = node.parent
+        if container is None:
+            continue
 
-    children: list[RedditCommentData] = []
-    child_container: Node | None = node.css_first("div.child div.sitetable")
-    if child_container:
-        for child_node in _get_direct_comment_children(child_container):
-            child_comment: RedditCommentData | None = _parse_comment_node(
-                node=child_node,
-                post_id=post_id,
-                depth=depth + 1,
+        parent_index: int | None = None
+        parent_id: str | None = None
+        depth: int = 0
+        if container.mem_id != area_id:
+            parent_node: Node | None = _reply_parent(container)
+            position: tuple[int, int, str] | None = (
+                positions.get(parent_node.mem_id) if parent_node else None
             )
-            if child_comment:
-                children.append(child_comment)
+            if position is None:
+                continue
+            parent_index, depth, parent_id = position[0], position[1] + 1, position[2]
 
+        if node.attrs.get("data-type") == "morechildren":
+            continue
+
+        ctx: _CommentParseContext | None = _build_comment_context(node, parent_id)
+        if ctx is None:
+            continue
+
+        positions[node.mem_id] = (len(positions), depth, ctx.comment_id)
+        yield ctx, depth, parent_index
+
+
+def _build_comment(
+    ctx: _CommentParseContext,
+    post_id: str | None,
+    depth: int,
+    children: tuple[RedditCommentData, ...] = (),
+) -> RedditCommentData:
+    """Build the RedditCommentData model for a parsed comment.
+
+    Args:
+        ctx: The parsed comment context.
+        post_id: The ID of the post the comment belongs to.
+        depth: Nesting depth of the comment (0 = top-level).
+        children: The already built replies to the comment.
+
+    Returns:
+        The comment model.
+    """
     return RedditCommentData(
         comment_id=ctx.comment_id,
         post_id=post_id,
@@ -660,11 +908,53 @@ def _parse_comment_node(
         stickied=ctx.stickied,
         permalink=ctx.permalink,
         depth=depth,
-        children=tuple(children),
+        children=children,
+    )
+
+
+def _parse_comment_tree(
+    comment_area: Node,
+    post_id: str | None,
+) -> tuple[RedditCommentData, ...]:
+    """Parse a comment thread into nested RedditCommentData models.
+
+    Because RedditCommentData is frozen, the models are built bottom-up by
+    walking the parsed comments in reverse, so every child exists before its
+    parent.
+
+    Args:
+        comment_area: The sitetable holding the top-level comments.
+        post_id: The ID of the post these comments belong to.
+
+    Returns:
+        Top-level RedditCommentData objects with their replies nested as children.
+    """
+    parsed: list[tuple[_CommentParseContext, int, int | None]] = list(
+        _iter_comment_contexts(comment_area),
     )
 
+    # Replies are collected last-to-first and reversed straight into the
+    # frozen tuple. Most comments are leaves, so only parents get a list.
+    replies: dict[int, list[RedditCommentData]] = {}
+    roots: list[RedditCommentData] = []
+    for index in range(len(parsed) - 1, -1, -1):
+        ctx, depth, parent_index = parsed[index]
+        comment: RedditCommentData = _build_comment(
+            ctx,
+            post_id,
+            depth,
+            tuple(reversed(replies.pop(index, ()))),
+        )
+        if parent_index is None:
+            roots.append(comment)
+        else:
+            replies.setdefault(parent_index, []).append(comment)
 
-class _PostParseContext(BaseModel):
+    return tuple(reversed(roots))
+
+
+@dataclass(slots=True, frozen=True)
+class _PostParseContext:
     """Context data extracted from a post node for building RedditPostData."""
 
     post_id: str | None
@@ -692,30 +982,29 @@ def _extract_post_author(post_node: Node) -> str | None:
     Returns:
         Author username or '[deleted]'.
     """
-    author_elem: Node | None = post_node.css_first("p.tagline a.author")
+    author_elem: Node | None = post_node.css_first(_SEL_POST_AUTHOR)
     if author_elem:
         return author_elem.text(strip=True)
 
-    tagline: Node | None = post_node.css_first("p.tagline")
+    tagline: Node | None = post_node.css_first(_SEL_TAGLINE)
     if tagline and "[deleted]" in tagline.text():
         return "[deleted]"
 
     return None
 
 
-def _extract_post_num_comments(post_node: Node) -> int | None:
-    """Extract number of comments from a post node.
+def _parse_int_attribute(value: str | None) -> int | None:
+    """Parse an integer data-* attribute value such as data-comments-count.
 
     Args:
-        post_node: The div.thing.link node.
+        value: The attribute value, if present.
 
     Returns:
-        Number of comments or None.
+        The integer or None if missing or not a number.
     """
-    comments_count_str: str | None = post_node.attributes.get("data-comments-count")
-    if comments_count_str:
+    if value:
         try:
-            return int(comments_count_str)
+            return int(value)
         except ValueError:
             return None
     return None
@@ -730,60 +1019,204 @@ def _build_post_context(post_node: Node) -> _PostParseContext:
     Returns:
         _PostParseContext with extracted data.
     """
-    post_id: str | None = _extract_fullname_id(
-        post_node.attributes.get("data-fullname")
-    )
-    title_elem: Node | None = post_node.css_first("a.title")
-    flair_elem: Node | None = post_node.css_first("span.linkflairlabel")
-    expando: Node | None = post_node.css_first("div.expando div.usertext-body div.md")
+    # Node.attributes builds a new dict on every access, so read it once
+    attributes: dict[str, str | None] = post_node.attributes
+    post_id: str | None = _extract_fullname_id(attributes.get("data-fullname"))
+    title_elem: Node | None = post_node.css_first(_SEL_POST_TITLE)
+    flair_elem: Node | None = post_node.css_first(_SEL_POST_FLAIR)
+    expando: Node | None = post_node.css_first(_SEL_POST_BODY)
 
     title_text: str | None = title_elem.text(strip=True) if title_elem else None
     title: str | None = _normalize_text(title_text)
 
+    score: int | None = _parse_int_attribute(attributes.get("data-score"))
+    if score is None:
+        score = _parse_score(post_node.css_first(_SEL_POST_SCORE))
+
     return _PostParseContext(
         post_id=post_id,
         title=title,
-        author=_extract_post_author(post_node),
-        subreddit=post_node.attributes.get("data-subreddit"),
-        score=_parse_score(post_node.css_first("div.score.unvoted")),
-        url=post_node.attributes.get("data-url"),
-        permalink=post_node.attributes.get("data-permalink"),
+        author=_intern(_extract_post_author(post_node)),
+        subreddit=_intern(attributes.get("data-subreddit")),
+        score=score,
+        url=attributes.get("data-url"),
+        permalink=attributes.get("data-permalink"),
         content_html=expando.html if expando else None,
-        date_posted=_parse_timestamp(post_node.css_first("time.live-timestamp")),
-        num_comments=_extract_post_num_comments(post_node),
-        is_nsfw=post_node.attributes.get("data-nsfw") == "true",
-        is_spoiler=post_node.attributes.get("data-spoiler") == "true",
-        domain=post_node.attributes.get("data-domain"),
+        date_posted=_parse_timestamp(post_node.css_first(_SEL_TIMESTAMP)),
+        num_comments=_parse_int_attribute(attributes.get("data-comments-count")),
+        is_nsfw=attributes.get("data-nsfw") == "true",
+        is_spoiler=attributes.get("data-spoiler") == "true",
+        domain=attributes.get("data-domain"),
         flair=flair_elem.text(strip=True) if flair_elem else None,
     )
 
 
-def _get_direct_comment_children(container: Node) -> list[Node]:
-    """Get direct comment children from a container node.
+def _reply_parent(container: Node) -> Node | None:
+    """Return the comment that owns a reply container.
+
+    Args:
+        container: The node directly above a reply, normally a div.sitetable.
+
+    Returns:
+        The div.thing.comment node whose div.child holds the container, or
+        None if the container is not a reply list.
+    """
+    if "sitetable" not in _class_set(container.attrs.get("class")):
+        return None
+
+    child_div: Node | None = container.parent
+    if child_div is None or "child" not in _class_set(
+        child_div.attrs.get("class"),
+    ):
+        return None
+
+    return child_div.parent
+
+
+def _find_direct_child(node: Node, css_class: str) -> Node | None:
+    """Find the first direct div child of a node that has the given class.
+
+    A descendant selector such as "div.entry" would scan the whole subtree,
+    replies included, which gets expensive for every comment of a deeply
+    nested thread. A comment's entry is always a direct child.
 
     Args:
-        container: A sitetable container node.
+        node: The node whose children to search.
+        css_class: The class the child div must have.
 
     Returns:
-        List of direct child comment nodes.
+        The matching child node, or None if there is none.
     """
-    children: list[Node] = []
-    for child in container.iter():
+    for child in node.iter():
         if child.tag != "div":
             continue
 
-        classes: str = child.attributes.get("class") or ""
-        if "thing" in classes and "comment" in classes:
-            children.append(child)
+        if css_class in _class_set(child.attrs.get("class")):
+            return child
+
+    return None
+
 
-    return children
+_PARSE_CACHE: OrderedDict[tuple[bytes, bool], RedditPostData] = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
 
 
-async def parse_reddit_post_html(response: Response) -> RedditPostData:
+def _page_digest(the_page: str | bytes) -> bytes:
+    """Return a short content hash of a page, used as the parse cache key.
+
+    Args:
+        the_page: The page HTML.
+
+    Returns:
+        A 16-byte BLAKE2b digest of the UTF-8 encoded page.
+    """
+    data: bytes = the_page.encode("utf-8") if isinstance(the_page, str) else the_page
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def clear_parse_cache() -> None:
+    """Forget every page memoized by parse_reddit_post_html()."""
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.clear()
+
+
+def parse_reddit_post_html(
+    the_page: str | bytes,
+    response: Response | None = None,
+    *,
+    include_comments: bool = True,
+) -> RedditPostData:
     """Parse Reddit post HTML and extract post metadata and comments.
 
+    Results are memoized by a hash of the page, so re-parsing the same bytes
+    is a dictionary lookup. Live downloads never repeat byte for byte
+    (old.reddit embeds a per-request server_time), so scrape_post() and
+    parse_reddit_post_html_batch() bypass the cache. The cache is guarded
+    by a lock, so this is safe to call from worker threads.
+
     Args:
-        response: The response from Reddit.
+        the_page: HTML of an old.reddit.com post page. UTF-8 bytes are parsed
+            directly, without decoding them to str first.
+        response: The response the HTML was read from, if any.
+        include_comments: Parse the comment thread. When False only the post
+            metadata is extracted and comments is left empty, which is much
+            faster for large threads.
+
+    Returns:
+        RedditPostData containing extracted post information and comments.
+        Pages that fail to parse raise RedditScraperError and are not cached.
+    """
+    key: tuple[bytes, bool] = (_page_digest(the_page), include_comments)
+    with _PARSE_CACHE_LOCK:
+        post: RedditPostData | None = _PARSE_CACHE.get(key)
+        if post is not None:
+            _PARSE_CACHE.move_to_end(key)
+
+    if post is None:
+        post = _parse_post_page(the_page, include_comments=include_comments)
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = post
+            if len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+
+    if response is None:
+        return post
+
+    # Cached posts carry no response; attach this one to a shallow copy
+    return post.model_copy(update={"response": response})
+
+
+def _html_snippet(the_page: str | bytes) -> str:
+    """Return the first 1000 characters of a page on one line, for debugging.
+
+    Args:
+        the_page: The page HTML.
+
+    Returns:
+        The start of the page with newlines replaced by spaces.
+    """
+    snippet: str | bytes = the_page[:1000]
+    if isinstance(snippet, bytes):
+        snippet = snippet.decode("utf-8", errors="replace")
+    return snippet.replace("\n", " ")
+
+
+def _page_before_comments(the_page: str | bytes) -> str | bytes:
+    """Return the part of a post page that comes before its comment area.
+
+    Everything the post metadata needs sits above the comments, so
+    metadata-only parses can skip building a DOM for the thread, which is
+    usually most of the page.
+
+    Args:
+        the_page: HTML of an old.reddit.com post page.
+
+    Returns:
+        The page up to the comment area, or the whole page if it has none.
+    """
+    if isinstance(the_page, bytes):
+        indexes: list[int] = [
+            the_page.find(tag.encode("ascii")) for tag in _COMMENT_AREA_TAGS
+        ]
+    else:
+        indexes = [the_page.find(tag) for tag in _COMMENT_AREA_TAGS]
+
+    found: list[int] = [index for index in indexes if index != -1]
+    return the_page[: min(found)] if found else the_page
+
+
+def _parse_post_page(
+    the_page: str | bytes,
+    response: Response | None = None,
+    *,
+    include_comments: bool = True,
+) -> RedditPostData:
+    """Parse a post page without consulting the cache.
+
+    Args:
+        the_page: HTML of an old.reddit.com post page.
+        response: The response the HTML was read from, if any.
+        include_comments: Whether to parse the comment thread.
 
     Returns:
         RedditPostData containing extracted post information and comments.
@@ -791,45 +1224,29 @@ async def parse_reddit_post_html(response: Response) -> RedditPostData:
     Raises:
         RedditScraperError: If the HTML cannot be parsed or required data is missing.
     """
-    the_page: str = await response.text()
-    parser = HTMLParser(the_page)
-
-    # Try original selector
-    post_node: Node | None = parser.css_first("div.thing.link")
-    # Try fallback selectors if not found
-    if not post_node:
-        # Try to find any div with class 'thing' and 'link' (in any order)
-        for node in parser.css("div.thing"):
-            classes: str = node.attributes.get("class") or ""
-            if "link" in classes:
-                post_node = node
-                break
+    parser = HTMLParser(
+        the_page if include_comments else _page_before_comments(the_page),
+    )
 
+    # Compound class selectors match in any order, so no fallback is needed
+    post_node: Node | None = parser.css_first(_SEL_POST)
     if not post_node:
-        # Debug: print first 1000 chars of HTML to help diagnose
-        debug_snippet: str = the_page[:1000].replace("\n", " ")
-        logger.debug(
-            "[DEBUG] Could not find post element. HTML snippet: %s",
-            debug_snippet,
+        # The snippet is only built if a sink actually wants DEBUG messages
+        logger.opt(lazy=True).debug(
+            "Could not find post element. HTML snippet: {}",
+            lambda: _html_snippet(the_page),
         )
         msg = "Could not find post element in HTML"
         raise RedditScraperError(msg)
 
     ctx: _PostParseContext = _build_post_context(post_node)
 
-    comments: list[RedditCommentData] = []
-    comment_area: Node | None = parser.css_first(
-        "div.commentarea div.sitetable.nestedlisting"
+    comments: tuple[RedditCommentData, ...] = ()
+    comment_area: Node | None = (
+        parser.css_first(_SEL_COMMENT_AREA) if include_comments else None
     )
     if comment_area:
-        for comment_node in _get_direct_comment_children(comment_area):
-            comment: RedditCommentData | None = _parse_comment_node(
-                node=comment_node,
-                post_id=ctx.post_id,
-                depth=0,
-            )
-            if comment:
-                comments.append(comment)
+        comments = _parse_comment_tree(comment_area, post_id=ctx.post_id)
 
     return RedditPostData(
         post_id=ctx.post_id,
@@ -846,14 +1263,70 @@ async def parse_reddit_post_html(response: Response) -> RedditPostData:
         is_spoiler=ctx.is_spoiler,
         domain=ctx.domain,
         flair=ctx.flair,
-        comments=tuple(comments),
+        comments=comments,
         response=response,
     )
 
 
+def parse_reddit_post_html_batch(
+    pages: Iterable[str | bytes],
+    *,
+    max_workers: int | None = None,
+) -> list[RedditPostData]:
+    """Parse many post pages in parallel worker processes.
+
+    Parsing holds the GIL for the Python-side tree walk, so threads cannot
+    parse several large pages at once. Worker processes can.
+
+    Args:
+        pages: HTML of old.reddit.com post pages.
+        max_workers: Number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        One RedditPostData per page, in input order.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_post_page, pages, chunksize=4))
+
+
+def iter_reddit_comments(the_page: str | bytes) -> Iterator[RedditCommentData]:
+    """Yield the comments of a post page one at a time, in document order.
+
+    Unlike parse_reddit_post_html(), this does not build the nested reply
+    tree. Each comment is yielded as soon as it is parsed, without children,
+    so callers can write huge threads out incrementally instead of holding
+    every model at once. parent_id and depth are set, so build_comment_tree()
+    can still reconstruct the hierarchy.
+
+    Args:
+        the_page: HTML of an old.reddit.com post page.
+
+    Yields:
+        RedditCommentData for every comment, with no children attached.
+
+    Raises:
+        RedditScraperError: If the post element cannot be found.
+    """
+    parser = HTMLParser(the_page)
+    post_node: Node | None = parser.css_first(_SEL_POST)
+    if not post_node:
+        msg = "Could not find post element in HTML"
+        raise RedditScraperError(msg)
+
+    post_id: str | None = _extract_fullname_id(post_node.attrs.get("data-fullname"))
+    comment_area: Node | None = parser.css_first(_SEL_COMMENT_AREA)
+    if not comment_area:
+        return
+
+    for ctx, depth, _parent_index in _iter_comment_contexts(comment_area):
+        yield _build_comment(ctx, post_id, depth)
+
+
 async def scrape_post(
     post_url: str | None = None,
     post_id: str | None = None,
+    *,
+    include_comments: bool = True,
 ) -> RedditPostData:
     """Scrape a single Reddit post by URL or ID.
 
@@ -862,6 +1335,7 @@ async def scrape_post(
     Args:
         post_url: Full Reddit post URL
         post_id: Reddit post ID (e.g., '1az7z6a')
+        include_comments: Whether to parse the comment thread.
 
     Returns:
         RedditPostData containing the scraped post information and comments.
@@ -882,8 +1356,68 @@ async def scrape_post(
         f"https://old.reddit.com/comments/{post_id}/",
     )
 
-    # Parse the HTML content to extract post details
-    return await parse_reddit_post_html(response=response)
+    # Raw bytes go straight to the parser, skipping a page-sized str copy
+    the_page: bytes = await response.bytes()
+
+    # Parse off the event loop so other downloads keep progressing
+    return await asyncio.to_thread(
+        _parse_post_page,
+        the_page,
+        response,
+        include_comments=include_comments,
+    )
+
+
+async def scrape_post_metadata(
+    post_url: str | None = None,
+    post_id: str | None = None,
+) -> RedditPostData:
+    """Scrape a Reddit post's metadata, skipping its comment thread.
+
+    The page is still downloaded in full, but parsing stops after the post
+    itself, so comments is always empty.
+
+    Args:
+        post_url: Full Reddit post URL
+        post_id: Reddit post ID (e.g., '1az7z6a')
+
+    Returns:
+        RedditPostData with the post information and no comments.
+    """
+    return await scrape_post(post_url, post_id, include_comments=False)
+
+
+async def scrape_posts(
+    items: Iterable[str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[RedditPostData | BaseException]:
+    """Scrape several Reddit posts concurrently.
+
+    Each item may be a full Reddit post URL or a bare post ID. At most
+    `concurrency` downloads are in flight at once, all sharing the same
+    pooled HTTP client.
+
+    Args:
+        items: Reddit post URLs and/or post IDs.
+        concurrency: Maximum number of posts scraped at the same time.
+
+    Returns:
+        One entry per item, in input order. Failed items hold the raised
+        exception instead of a RedditPostData.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _scrape_one(item: str) -> RedditPostData:
+        async with semaphore:
+            if _is_post_id(item):
+                return await scrape_post(post_id=item)
+            return await scrape_post(post_url=item)
+
+    return await asyncio.gather(
+        *(_scrape_one(item) for item in items),
+        return_exceptions=True,
+    )
 
 
 def extract_post_id_from_url(post_url: str | None) -> str | None:
@@ -900,6 +1434,11 @@ def extract_post_id_from_url(post_url: str | None) -> str | None:
     """
     post_id: str | None = None
     if post_url:
+        # Fast path for the usual URL shapes; anything else gets full parsing
+        match: re.Match[str] | None = _POST_URL_RE.match(post_url)
+        if match:
+            return match.group("post_id").lower()
+
         info: RedditUrlInfo = get_reddit_id_from_url(post_url)
         if not info.post_id:
             msg = "Provided URL does not point to a Reddit post"
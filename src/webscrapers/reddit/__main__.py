@@ -1,42 +1,129 @@
 from __future__ import annotations
 
 import asyncio
-import logging
-import pprint
+import importlib.util
+import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from loguru import logger
 
 from webscrapers.reddit import RedditPostData
-from webscrapers.reddit import scrape_post
+from webscrapers.reddit import scrape_posts
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _output_path(post_data: RedditPostData, position: int, *, batch: bool) -> Path:
+    """Return where to save a scraped post.
+
+    A single post keeps the historical reddit_post.json name; batches get
+    one file per post ID so results do not overwrite each other. A post
+    whose ID could not be parsed is named after its 1-based position on the
+    command line instead.
+
+    Args:
+        post_data: The scraped post.
+        position: The 1-based position of the post's URL in the arguments.
+        batch: Whether more than one post was requested.
+
+    Returns:
+        The JSON output path.
+    """
+    if not batch:
+        return Path("reddit_post.json")
+    return Path(f"reddit_post_{post_data.post_id or position}.json")
+
+
+def _json_indent() -> int | None:
+    """Return the indentation for saved JSON, read from REDDIT_JSON_INDENT.
+
+    Output is compact by default; set REDDIT_JSON_INDENT=4 (or any positive
+    number) to pretty-print it for reading.
+
+    Returns:
+        The number of spaces to indent with, or None for compact output.
+    """
+    value: str = os.environ.get("REDDIT_JSON_INDENT", "").strip()
+    if not value.isdecimal():
+        return None
+    return int(value) or None
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's event loop factory if it is installed.
+
+    uvloop is an optional dependency (the "uvloop" extra); without it the
+    default asyncio event loop is used.
+
+    Returns:
+        uvloop.new_event_loop, or None to use the default loop.
+    """
+    if importlib.util.find_spec("uvloop") is None:
+        return None
+
+    import uvloop  # noqa: PLC0415
+
+    return uvloop.new_event_loop
 
 
 def main() -> None:
-    """Scrape a Reddit post from command line argument and pretty print the result."""
-    # Configure logging to show DEBUG messages
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(levelname)s:%(name)s:%(message)s",
-    )
+    """Scrape Reddit posts from command line arguments and save them as JSON."""
     if len(sys.argv) < 2:  # noqa: PLR2004
         sys.exit(1)
-    url: str = sys.argv[1]
-
-    async def run() -> None:
-        post_data: RedditPostData = await scrape_post(post_url=url)
-        logger.debug(pprint.pformat(post_data))
-        logger.info("Scraped Reddit post from URL: {}", url)
-
-        # Save to JSON file
-        output_path = Path("reddit_post.json")
-        output_path.write_text(  # noqa: ASYNC240
-            RedditPostData.model_validate(post_data).model_dump_json(indent=4),
-            encoding="utf-8",
-        )
-        logger.info("Saved scraped data to {}", output_path)
-
-    asyncio.run(run())
+    urls: list[str] = sys.argv[1:]
+    batch: bool = len(urls) > 1
+    indent: int | None = _json_indent()
+
+    async def run() -> bool:
+        results: list[RedditPostData | BaseException] = await scrape_posts(urls)
+
+        ok = True
+        saved: dict[Path, str] = {}
+        for position, (url, post_data) in enumerate(
+            zip(urls, results, strict=True),
+            start=1,
+        ):
+            if isinstance(post_data, BaseException):
+                logger.error("Failed to scrape Reddit post {}: {}", url, post_data)
+                ok = False
+                continue
+
+            logger.opt(lazy=True).debug(
+                "post_data={}", lambda post=post_data: post.model_dump_json(indent=2)
+            )
+            logger.info("Scraped Reddit post from URL: {}", url)
+
+            # The same post can be passed twice, e.g. as a shortlink and a permalink
+            output_path: Path = _output_path(post_data, position, batch=batch)
+            if output_path in saved:
+                logger.warning(
+                    "{} is the same post as {}, already saved to {}",
+                    url,
+                    saved[output_path],
+                    output_path,
+                )
+                continue
+            saved[output_path] = url
+
+            # Save to JSON file off the event loop
+            await asyncio.to_thread(
+                output_path.write_text,
+                post_data.model_dump_json(indent=indent),
+                encoding="utf-8",
+            )
+            logger.info("Saved scraped data to {}", output_path)
+
+        return ok
+
+    # asyncio.Runner takes a loop_factory on every supported Python version
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        ok: bool = runner.run(run())
+
+    if not ok:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
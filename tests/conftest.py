@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from webscrapers.reddit import clear_parse_cache
+from webscrapers.reddit import get_reddit_id_from_url
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def pytest_runtest_teardown(item: pytest.Item) -> None:  # noqa: ARG001
+    """Keep memoized URLs and parsed pages from leaking between tests."""
+    get_reddit_id_from_url.cache_clear()
+    clear_parse_cache()
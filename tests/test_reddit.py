@@ -1,8 +1,41 @@
+import asyncio
+import sys
+from datetime import UTC
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import cast
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+
 import pytest
 
+from webscrapers import reddit
+from webscrapers.reddit import RedditPostData
 from webscrapers.reddit import RedditScraperError
 from webscrapers.reddit import RedditUrlInfo
+from webscrapers.reddit import build_comment_tree
+from webscrapers.reddit import clear_parse_cache
+from webscrapers.reddit import extract_post_id_from_url
 from webscrapers.reddit import get_reddit_id_from_url
+from webscrapers.reddit import iter_reddit_comments
+from webscrapers.reddit import parse_reddit_post_html
+from webscrapers.reddit import parse_reddit_post_html_batch
+from webscrapers.reddit import scrape_posts
+
+if TYPE_CHECKING:
+    from rnet import Response
+
+
+@pytest.fixture(scope="session")
+def example_post_html() -> bytes:
+    fixture_path: Path = Path(__file__).parent / "reddit_post_example.html"
+    return fixture_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def example_post_parsed(example_post_html: bytes) -> RedditPostData:
+    return parse_reddit_post_html(example_post_html)
 
 
 def test_parses_standard_post_url() -> None:
@@ -46,6 +79,13 @@ def test_parses_user_profile_url() -> None:
     assert info.username == "killyoy"
 
 
+def test_parses_user_profile_subpage_url() -> None:
+    info = get_reddit_id_from_url("https://www.reddit.com/user/killyoy/submitted/")
+
+    assert info.kind == "user"
+    assert info.username == "killyoy"
+
+
 def test_parses_subreddit_root() -> None:
     info = get_reddit_id_from_url("https://old.reddit.com/r/nvidia/")
 
@@ -67,11 +107,301 @@ def test_parses_frontpage() -> None:
     assert info.kind == "frontpage"
 
 
+def test_url_info_reports_whether_it_points_to_a_post() -> None:
+    post = get_reddit_id_from_url("https://redd.it/npm69h")
+    subreddit = get_reddit_id_from_url("https://old.reddit.com/r/nvidia/")
+
+    assert post.has_post
+    assert not subreddit.has_post
+    with pytest.raises(AttributeError):
+        post.post_id = "abcdef"  # type: ignore[misc]
+
+
+def test_reuses_parsed_info_for_repeated_url() -> None:
+    url = "https://old.reddit.com/r/nvidia/comments/npm69h/"
+
+    assert get_reddit_id_from_url(url) is get_reddit_id_from_url(url)
+
+
 def test_raises_for_non_reddit_url() -> None:
     with pytest.raises(RedditScraperError):
         get_reddit_id_from_url("https://example.com/foo")
 
 
+def test_rejects_unicode_lookalike_post_host() -> None:
+    with pytest.raises(RedditScraperError):
+        extract_post_id_from_url("https://old.redd\u0130t.com/r/x/comments/abcde/")
+
+
 def test_raises_for_empty_url() -> None:
     with pytest.raises(RedditScraperError):
         get_reddit_id_from_url("   ")
+
+
+async def test_scrape_posts_limits_concurrency_and_keeps_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def fake_scrape_post(
+        post_url: str | None = None,
+        post_id: str | None = None,
+    ) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if post_url == "https://example.com/foo":
+            raise RedditScraperError(post_url)
+        return post_id or post_url or ""
+
+    monkeypatch.setattr(reddit, "scrape_post", fake_scrape_post)
+
+    items = ["npm69h", "https://example.com/foo", *(f"abc{i:03d}" for i in range(8))]
+    results = await scrape_posts(items, concurrency=3)
+
+    assert peak == 3
+    assert results[0] == "npm69h"
+    assert isinstance(results[1], RedditScraperError)
+    assert results[2:] == items[2:]
+
+
+def test_parses_post_metadata(example_post_parsed: RedditPostData) -> None:
+    post = example_post_parsed
+
+    assert post.post_id == "1lqa2hj"
+    assert post.title is not None
+    assert post.title.startswith("Has Xbox Considered Laying One Person Off")
+    assert post.subreddit == "Games"
+    assert post.score == 8724
+    assert post.num_comments == 978
+    assert post.domain == "aftermath.site"
+    assert post.flair == "Opinion Piece"
+    assert post.response is None
+
+
+def test_parses_post_date(example_post_parsed: RedditPostData) -> None:
+    post = example_post_parsed
+
+    assert post.date_posted == datetime(2025, 7, 2, 23, 1, 35, tzinfo=UTC)
+    assert post.comments[0].date_posted == datetime(2025, 7, 2, 23, 6, 22, tzinfo=UTC)
+
+
+def test_parses_post_metadata_without_comments(
+    example_post_html: bytes,
+    example_post_parsed: RedditPostData,
+) -> None:
+    post = parse_reddit_post_html(example_post_html, include_comments=False)
+
+    assert post.comments == ()
+    assert post.model_dump(exclude={"comments"}) == example_post_parsed.model_dump(
+        exclude={"comments"},
+    )
+
+
+def test_parses_post_from_bytes(example_post_html: bytes) -> None:
+    from_bytes = parse_reddit_post_html(example_post_html)
+    clear_parse_cache()
+    from_str = parse_reddit_post_html(example_post_html.decode("utf-8"))
+
+    assert from_bytes is not from_str
+    assert from_bytes == from_str
+
+
+def test_reuses_parsed_post_for_unchanged_page(example_post_html: bytes) -> None:
+    first = parse_reddit_post_html(example_post_html)
+    response = cast("Response", object())
+    with_response = parse_reddit_post_html(example_post_html, response)
+
+    assert parse_reddit_post_html(example_post_html) is first
+    assert with_response.response is response
+    assert with_response.comments is first.comments
+    assert first.response is None
+
+
+async def test_scrape_post_bypasses_parse_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    example_post_html: bytes,
+) -> None:
+    response = MagicMock()
+    response.bytes = AsyncMock(return_value=example_post_html)
+    download_page = AsyncMock(return_value=response)
+    parsed_with: list[object] = []
+    parse_post_page = reddit._parse_post_page  # noqa: SLF001
+
+    def spy_parse_post_page(
+        the_page: bytes,
+        response: object,
+        *,
+        include_comments: bool,
+    ) -> RedditPostData:
+        parsed_with.append(response)
+        return parse_post_page(the_page, include_comments=include_comments)
+
+    monkeypatch.setattr(reddit, "download_page", download_page)
+    monkeypatch.setattr(reddit, "_parse_post_page", spy_parse_post_page)
+
+    post = await reddit.scrape_post(post_id="1lqa2hj")
+
+    download_page.assert_awaited_once_with("https://old.reddit.com/comments/1lqa2hj/")
+    assert post.post_id == "1lqa2hj"
+    assert parsed_with == [response]
+    assert not reddit._PARSE_CACHE  # noqa: SLF001
+
+
+def test_parses_post_batch_in_worker_processes(example_post_html: bytes) -> None:
+    posts = parse_reddit_post_html_batch(
+        [example_post_html, example_post_html.decode("utf-8")],
+        max_workers=2,
+    )
+
+    assert posts == [parse_reddit_post_html(example_post_html)] * 2
+
+
+def test_parses_comments(example_post_parsed: RedditPostData) -> None:
+    post = example_post_parsed
+    first = post.comments[0]
+
+    assert len(post.comments) == 17
+    assert first.comment_id == "n113cp2"
+    assert first.post_id == "1lqa2hj"
+    assert first.parent_id is None
+    assert first.score == 2215
+    assert first.depth == 0
+
+
+def test_parses_nested_comments(example_post_parsed: RedditPostData) -> None:
+    post = example_post_parsed
+    reply = post.comments[0].children[0]
+
+    assert len(post.comments[0].children) == 10
+    assert reply.comment_id == "n113i94"
+    assert reply.parent_id == "n113cp2"
+    assert reply.depth == 1
+
+
+def _nested_comment_html(index: int, replies: str) -> str:
+    return (
+        f'<div class="thing comment" data-fullname="t1_c{index:06d}">'
+        '<div class="entry"><div class="usertext-body">'
+        f'<div class="md"><p>comment {index}</p></div>'
+        "</div></div>"
+        f'<div class="child"><div class="sitetable">{replies}</div></div>'
+        "</div>"
+    )
+
+
+def test_parses_deeply_nested_comments_without_recursion() -> None:
+    depth = 1200
+    replies = ""
+    for index in reversed(range(depth)):
+        replies = _nested_comment_html(index, replies)
+    html = (
+        '<div class="thing link" data-fullname="t3_abcdef"></div>'
+        '<div class="commentarea"><div class="sitetable nestedlisting">'
+        f"{replies}</div></div>"
+    )
+
+    post = parse_reddit_post_html(html)
+
+    comment = post.comments[0]
+    while comment.children:
+        assert len(comment.children) == 1
+        comment = comment.children[0]
+    assert comment.comment_id == f"c{depth - 1:06d}"
+    assert comment.depth == depth - 1
+
+
+def test_parses_sibling_branches_in_document_order() -> None:
+    thread = _nested_comment_html(
+        0,
+        _nested_comment_html(1, _nested_comment_html(2, ""))
+        + _nested_comment_html(3, ""),
+    ) + _nested_comment_html(4, "")
+    html = (
+        '<div class="thing link" data-fullname="t3_abcdef"></div>'
+        '<div class="commentarea"><div class="sitetable nestedlisting">'
+        f"{thread}</div></div>"
+    )
+
+    post = parse_reddit_post_html(html)
+
+    first, second = post.comments
+    assert [c.comment_id for c in first.children] == ["c000001", "c000003"]
+    assert first.children[0].children[0].comment_id == "c000002"
+    assert first.children[0].children[0].depth == 2
+    assert first.children[1].depth == 1
+    assert second.comment_id == "c000004"
+    assert second.depth == 0
+    assert second.children == ()
+
+
+def test_shares_repeated_author_and_subreddit_names(
+    example_post_html: bytes,
+) -> None:
+    authors = [
+        comment.author
+        for comment in iter_reddit_comments(example_post_html)
+        if comment.author == "DrKushnstein"
+    ]
+    post = parse_reddit_post_html(example_post_html)
+
+    assert len(authors) == 2
+    assert authors[0] is authors[1]
+    assert authors[0] is sys.intern("DrKushnstein")
+    assert post.subreddit is sys.intern("Games")
+    assert post.author is not None
+    assert post.author is sys.intern(post.author)
+
+
+def test_iter_reddit_comments_yields_flat_comments(
+    example_post_html: bytes,
+    example_post_parsed: RedditPostData,
+) -> None:
+    comments = list(iter_reddit_comments(example_post_html))
+
+    assert len(comments) == 174
+    assert all(comment.children == () for comment in comments)
+    assert comments[0].comment_id == "n113cp2"
+    assert comments[1].comment_id == "n113i94"
+    assert comments[1].depth == 1
+
+    tree = build_comment_tree(comments)
+    top_level = [comment.comment_id for comment in example_post_parsed.comments]
+    assert [comment.comment_id for comment in tree[None]] == top_level
+
+
+def test_parses_parent_ids_from_thread_and_parent_link() -> None:
+    root = _nested_comment_html(1, _nested_comment_html(2, "")).replace(
+        '<div class="usertext-body">',
+        '<a data-event-action="parent" href="#c000000">parent</a>'
+        '<div class="usertext-body">',
+        1,
+    )
+    html = (
+        '<div class="thing link" data-fullname="t3_abcdef"></div>'
+        '<div class="commentarea"><div class="sitetable nestedlisting">'
+        f"{root}</div></div>"
+    )
+
+    post = parse_reddit_post_html(html)
+
+    # A comment permalink page starts below the top of the thread
+    assert post.comments[0].parent_id == "c000000"
+    assert post.comments[0].children[0].parent_id == "c000001"
+
+
+def test_build_comment_tree_groups_by_parent(
+    example_post_parsed: RedditPostData,
+) -> None:
+    post = example_post_parsed
+    top_level = list(post.comments)
+    replies = list(post.comments[0].children)
+
+    tree = build_comment_tree(top_level + replies)
+
+    assert type(tree) is dict
+    assert tree[None] == top_level
+    assert tree["n113cp2"] == replies
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from webscrapers.reddit import RedditPostData
+from webscrapers.reddit import RedditScraperError
+from webscrapers.reddit import __main__ as cli
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+
+def _run_main(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    results: dict[str, RedditPostData | BaseException],
+) -> None:
+    async def fake_scrape_posts(  # noqa: RUF029
+        items: Iterable[str],
+    ) -> list[RedditPostData | BaseException]:
+        return [results[item] for item in items]
+
+    monkeypatch.setattr(cli, "scrape_posts", fake_scrape_posts)
+    monkeypatch.setattr(sys, "argv", ["webscrapers.reddit", *results])
+    monkeypatch.chdir(tmp_path)
+    cli.main()
+
+
+def test_main_saves_single_post_as_reddit_post_json(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _run_main(monkeypatch, tmp_path, {"abcde": RedditPostData(post_id="abcde")})
+
+    saved = json.loads((tmp_path / "reddit_post.json").read_text(encoding="utf-8"))
+    assert saved["post_id"] == "abcde"
+    assert [path.name for path in tmp_path.iterdir()] == ["reddit_post.json"]
+
+
+def test_main_saves_batch_posts_per_id(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _run_main(
+        monkeypatch,
+        tmp_path,
+        {
+            "abcde": RedditPostData(post_id="abcde"),
+            "https://old.reddit.com/r/x/comments/fghij/": RedditPostData(
+                post_id="fghij",
+            ),
+            "klmno": RedditPostData(),
+        },
+    )
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "reddit_post_3.json",
+        "reddit_post_abcde.json",
+        "reddit_post_fghij.json",
+    ]
+
+
+def test_main_saves_duplicate_post_once(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    _run_main(
+        monkeypatch,
+        tmp_path,
+        {
+            "https://redd.it/abcde": RedditPostData(post_id="abcde", title="first"),
+            "https://old.reddit.com/r/x/comments/abcde/": RedditPostData(
+                post_id="abcde",
+                title="second",
+            ),
+        },
+    )
+
+    saved_path = tmp_path / "reddit_post_abcde.json"
+    assert [path.name for path in tmp_path.iterdir()] == [saved_path.name]
+    assert json.loads(saved_path.read_text(encoding="utf-8"))["title"] == "first"
+
+
+def test_main_saves_other_posts_then_exits_with_error_on_failure(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        _run_main(
+            monkeypatch,
+            tmp_path,
+            {
+                "https://example.com/foo": RedditScraperError("not reddit"),
+                "abcde": RedditPostData(post_id="abcde"),
+            },
+        )
+
+    assert exc_info.value.code == 1
+    assert [path.name for path in tmp_path.iterdir()] == ["reddit_post_abcde.json"]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("0", None),
+        ("4", 4),
+        (" 2 ", 2),
+        ("-2", None),
+        ("four", None),
+        ("²", None),
+    ],
+)
+def test_json_indent_reads_environment(
+    monkeypatch: pytest.MonkeyPatch,
+    value: str | None,
+    expected: int | None,
+) -> None:
+    if value is None:
+        monkeypatch.delenv("REDDIT_JSON_INDENT", raising=False)
+    else:
+        monkeypatch.setenv("REDDIT_JSON_INDENT", value)
+
+    assert cli._json_indent() == expected  # noqa: SLF001
+
+
+def test_main_writes_compact_json_unless_indent_is_set(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    results = {"abcde": RedditPostData(post_id="abcde")}
+    output_path = tmp_path / "reddit_post.json"
+
+    monkeypatch.delenv("REDDIT_JSON_INDENT", raising=False)
+    _run_main(monkeypatch, tmp_path, results)
+    assert "\n" not in output_path.read_text(encoding="utf-8")
+
+    monkeypatch.setenv("REDDIT_JSON_INDENT", "4")
+    _run_main(monkeypatch, tmp_path, results)
+    assert '\n    "post_id": "abcde"' in output_path.read_text(encoding="utf-8")
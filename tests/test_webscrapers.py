@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import field
+
+import pytest
+
+import webscrapers
+from webscrapers import download_page
+
+
+@dataclass
+class _FakeResponse:
+    status: int
+    headers: dict[str, bytes] = field(default_factory=dict)
+
+
+class _FakeClient:
+    def __init__(self, responses: dict[str, list[_FakeResponse]]) -> None:
+        self.responses = responses
+        self.requested: list[str] = []
+
+    async def get(self, url: str) -> _FakeResponse:
+        self.requested.append(url)
+        return self.responses[url].pop(0)
+
+
+@pytest.fixture
+def fake_client(monkeypatch: pytest.MonkeyPatch) -> _FakeClient:
+    client = _FakeClient({})
+    monkeypatch.setattr(webscrapers, "_get_client", lambda: client)
+    monkeypatch.setattr(webscrapers, "RETRY_BACKOFF_SECONDS", 0)
+    return client
+
+
+async def test_download_page_follows_relative_redirect(
+    fake_client: _FakeClient,
+) -> None:
+    fake_client.responses = {
+        "https://old.reddit.com/comments/abcde/": [
+            _FakeResponse(301, {"Location": b"/r/foo/comments/abcde/"}),
+        ],
+        "https://old.reddit.com/r/foo/comments/abcde/": [_FakeResponse(200)],
+    }
+
+    resp = await download_page("https://old.reddit.com/comments/abcde/")
+
+    assert resp.status == 200
+    assert fake_client.requested[-1] == "https://old.reddit.com/r/foo/comments/abcde/"
+
+
+async def test_download_page_retries_transient_errors(fake_client: _FakeClient) -> None:
+    fake_client.responses = {
+        "https://old.reddit.com/": [
+            _FakeResponse(503),
+            _FakeResponse(429, {"Retry-After": b"0"}),
+            _FakeResponse(200),
+        ],
+    }
+
+    resp = await download_page("https://old.reddit.com/")
+
+    assert resp.status == 200
+    assert len(fake_client.requested) == 3
+
+
+@pytest.mark.parametrize("retry_after", [b"soon", b"\xc2\xb2", b"\xff1"])
+async def test_download_page_backs_off_on_malformed_retry_after(
+    fake_client: _FakeClient,
+    retry_after: bytes,
+) -> None:
+    fake_client.responses = {
+        "https://old.reddit.com/": [
+            _FakeResponse(503, {"Retry-After": retry_after}),
+            _FakeResponse(200),
+        ],
+    }
+
+    resp = await download_page("https://old.reddit.com/")
+
+    assert resp.status == 200
+    assert len(fake_client.requested) == 2
+
+
+async def test_download_page_gives_up_after_max_attempts(
+    fake_client: _FakeClient,
+) -> None:
+    fake_client.responses = {
+        "https://old.reddit.com/": [_FakeResponse(500) for _ in range(5)],
+    }
+
+    resp = await download_page("https://old.reddit.com/")
+
+    assert resp.status == 500
+    assert len(fake_client.requested) == webscrapers.MAX_ATTEMPTS
+
+
+async def test_download_page_raises_on_redirect_loop(fake_client: _FakeClient) -> None:
+    fake_client.responses = {
+        "https://old.reddit.com/a": [_FakeResponse(302, {"Location": b"/b"})],
+        "https://old.reddit.com/b": [_FakeResponse(302, {"Location": b"/a"})],
+    }
+
+    with pytest.raises(RuntimeError, match="Redirect loop"):
+        await download_page("https://old.reddit.com/a")
+
+
+async def test_get_client_is_shared_until_aclose(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(webscrapers, "_CLIENT", None)
+
+    client = webscrapers._get_client()  # noqa: SLF001
+    assert webscrapers._get_client() is client  # noqa: SLF001
+
+    await webscrapers.aclose()
+    assert webscrapers._CLIENT is None  # noqa: SLF001
+    assert webscrapers._get_client() is not client  # noqa: SLF001